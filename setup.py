@@ -10,6 +10,7 @@ setup(
     keywords = "flexbackup backup",
     url = "http://packages.python.org/an_example_pypi_project",
     scripts = ['flexbackup-manager'],
+    python_requires = ">=3.7",
     long_description='''
         This script is a backup scheduler built upon flexbackup
         that manages backup set according to their tiers and